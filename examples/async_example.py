@@ -11,6 +11,11 @@ import os
 import sys
 from flash_call import set_key, push_alert_async
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 
 async def send_alert(title: str, status: str, labels: dict):
     """Helper function to send an alert asynchronously."""
@@ -132,4 +137,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
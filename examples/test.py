@@ -1,36 +1,81 @@
+import sys
 import threading
 import time
 
+# 缩短 GIL 切换间隔, 不需要在每次迭代里 sleep(0) 也能暴露竞争
+sys.setswitchinterval(1e-6)
+
+n_threads = 20
+n_iterations = 50000
+key = "a"
+expected = n_threads * n_iterations
+
+
+# 反例 (pitfall): 所有线程对共享 dict 做读-改-写, 会丢失更新
+# 更快的 numpy / 多进程版本见 test_fast.py
 class ComplexObject:
     def __init__(self):
         self.data = {"a": 0, "b": 0, "c": 0}
+        self.lock = threading.Lock()
 
     def unsafe_update(self, key):
         old_value = self.data.get(key, 0)
-        time.sleep(0)          # 强制切换点
         new_value = old_value + 1
         self.data[key] = new_value
 
+    def safe_update(self, key):
+        with self.lock:
+            self.data[key] += 1
+
 obj = ComplexObject()
-n_threads = 20
-n_iterations = 50000
-key = "a"
 
 def complex_worker():
     for _ in range(n_iterations):
         obj.unsafe_update(key)
 
-threads = [threading.Thread(target=complex_worker) for _ in range(n_threads)]
 
-t0 = time.perf_counter()
-for t in threads:
-    t.start()
-for t in threads:
-    t.join()
-t1 = time.perf_counter()
+# 修正 1: 用锁保护读-改-写, 结果正确但每次迭代都要加锁
+locked_obj = ComplexObject()
 
-expected = n_threads * n_iterations
-actual = obj.data[key]
-print(f"Key '{key}' - Expected: {expected}, Actual: {actual}")
-print(f"Lost updates: {expected - actual}")
-print(f"Time: {t1 - t0:.3f}s")
\ No newline at end of file
+def locked_worker():
+    for _ in range(n_iterations):
+        locked_obj.safe_update(key)
+
+
+# 修正 2: 每个线程使用自己的计数器, 结束时只加一次锁提交结果
+results = []
+results_lock = threading.Lock()
+
+def local_worker():
+    local = {key: 0}
+    for _ in range(n_iterations):
+        local[key] += 1
+    with results_lock:
+        results.append(local)
+
+
+def run(worker):
+    threads = [threading.Thread(target=worker) for _ in range(n_threads)]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - t0
+
+
+def report(name, actual, elapsed):
+    print(f"[{name}]")
+    print(f"Key '{key}' - Expected: {expected}, Actual: {actual}")
+    print(f"Lost updates: {expected - actual}")
+    print(f"Time: {elapsed:.3f}s ({expected / elapsed:,.0f} updates/s)")
+
+
+elapsed = run(complex_worker)
+report("shared dict, unsafe", obj.data[key], elapsed)
+
+elapsed = run(locked_worker)
+report("shared dict, locked", locked_obj.data[key], elapsed)
+
+elapsed = run(local_worker)
+report("per-thread accumulator", sum(r[key] for r in results), elapsed)
@@ -0,0 +1,91 @@
+"""Faster alternatives to the thread counter in test.py.
+
+Because of the GIL, the threads in test.py never run in parallel. This script
+counts the same n_threads * n_iterations increments with:
+1. A single NumPy vector reduction
+2. A ProcessPoolExecutor, one worker process per CPU
+3. The same 20 threads as test.py, each running a Numba-compiled loop
+   (skipped if numba is not installed)
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+n_threads = 20
+n_iterations = 50000
+expected = n_threads * n_iterations
+
+
+def count(n):
+    total = 0
+    for _ in range(n):
+        total += 1
+    return total
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _bump(n):
+        s = 0
+        for _ in range(n):
+            s += 1
+        return s
+
+
+def numba_worker(results, results_lock):
+    local = _bump(n_iterations)
+    with results_lock:
+        results.append(local)
+
+
+def main():
+    # 1. NumPy: the whole count is one C-level reduction
+    t0 = time.perf_counter()
+    total = int(np.full(expected, 1, dtype=np.int64).sum())
+    t1 = time.perf_counter()
+    print("[numpy]")
+    print(f"Expected: {expected}, Actual: {total}")
+    print(f"Time: {t1 - t0:.3f}s")
+
+    # 2. Processes: each worker counts its share on its own core
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        total = sum(pool.map(count, [n_iterations] * n_threads))
+    t1 = time.perf_counter()
+    print("[process pool]")
+    print(f"Expected: {expected}, Actual: {total}")
+    print(f"Time: {t1 - t0:.3f}s")
+
+    # 3. Numba: threads keep their shape, the loop itself runs as machine code
+    if njit is None:
+        print("[numba] skipped, numba is not installed")
+        return
+    _bump(1)  # compile before timing
+    results = []
+    results_lock = threading.Lock()
+    threads = [
+        threading.Thread(target=numba_worker, args=(results, results_lock))
+        for _ in range(n_threads)
+    ]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    t1 = time.perf_counter()
+    print("[numba]")
+    print(f"Expected: {expected}, Actual: {sum(results)}")
+    print(f"Time: {t1 - t0:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,31 @@ A Python SDK for pushing alert events to Flashduty using standard HTTP protocol.
 Supports both synchronous and asynchronous operations.
 """
 
-from typing import Dict, List, Literal, Optional, TypedDict, Union
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypedDict,
+    Union,
+)
+import asyncio
+import atexit
 import httpx
 import logging
+import msgspec
+import os
+import threading
+import time
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -14,6 +36,8 @@ logger = logging.getLogger(__name__)
 
 # Type definitions
 EventStatus = Literal["Critical", "Warning", "Info", "Ok"]
+# Maps each valid status to its canonical string object
+_STATUSES = {status: status for status in ("Critical", "Warning", "Info", "Ok")}
 
 
 class Image(TypedDict, total=False):
@@ -51,6 +75,22 @@ class SimpleErrorResponse(TypedDict):
     error: str
 
 
+class _PushAlertRequest(msgspec.Struct, omit_defaults=True):
+    """Request body for the standard alert push API."""
+    title_rule: str
+    event_status: str
+    alert_key: Optional[str] = None
+    description: Optional[str] = None
+    labels: Optional[Dict[str, str]] = None
+    images: Optional[List[Image]] = None
+
+
+# Dict keys are sorted so identical alerts always encode to the same bytes
+_encoder = msgspec.json.Encoder(order="deterministic")
+# Responses are decoded without a schema so the server's body reaches the caller unchanged
+_decoder = msgspec.json.Decoder()
+
+
 # Global integration key storage
 _integration_key: Optional[str] = None
 _user: Optional[str] = None
@@ -58,23 +98,476 @@ _strategy: Optional[str] = None
 
 # Base URL for Flashduty API
 BASE_URL = "https://api.flashcat.cloud/event/push/alert/standard"
+_HEADERS = {"Content-Type": "application/json"}
+
+# Request URL for the global integration key, precomputed by set_key()
+_url: Optional[httpx.URL] = None
+
+# Shared HTTP clients, created lazily and reused across calls so that
+# connections to the Flashduty API stay alive between alerts.
+_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=100)
+_TIMEOUT = httpx.Timeout(10.0)
+# HTTP/2 lets concurrent alerts share a single connection; set FLASHDUTY_HTTP2=0 to disable.
+_HTTP2 = os.getenv("FLASHDUTY_HTTP2", "1") != "0"
+
+# Failed connections are retried by the transport; rate-limited and 5xx responses
+# are retried with exponential backoff over the same pooled client. Both allow at
+# most _MAX_ATTEMPTS attempts per request.
+_MAX_ATTEMPTS = 3
+_MAX_BACKOFF = 2.0
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+# An httpx.AsyncClient is bound to the event loop it was first used on, so each
+# loop gets its own client.
+_async_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def _get_client() -> httpx.Client:
+    """Return the shared synchronous client, creating it on first use."""
+    global _client
+    client = _client
+    if client is None or client.is_closed:
+        with _client_lock:
+            if _client is None or _client.is_closed:
+                transport = httpx.HTTPTransport(retries=_MAX_ATTEMPTS - 1, limits=_LIMITS, http2=_HTTP2)
+                _client = httpx.Client(transport=transport, timeout=_TIMEOUT)
+            client = _client
+    return client
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Return the shared asynchronous client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        with _client_lock:
+            _drop_closed_loops()
+            transport = httpx.AsyncHTTPTransport(retries=_MAX_ATTEMPTS - 1, limits=_LIMITS, http2=_HTTP2)
+            client = _async_clients[loop] = httpx.AsyncClient(transport=transport, timeout=_TIMEOUT)
+    return client
+
+
+def _drop_closed_loops() -> None:
+    """Forget async clients whose event loop has been closed."""
+    for loop in [loop for loop in _async_clients if loop.is_closed()]:
+        client = _async_clients.pop(loop)
+        if not client.is_closed:
+            logger.debug("Dropping async client of a closed event loop, use aclose() to close it")
+
+
+def _backoff(response: httpx.Response, attempt: int) -> Optional[float]:
+    """Return the delay in seconds before retry number ``attempt`` (0-based).
+
+    A ``Retry-After`` header on the response takes precedence over the
+    exponential backoff. If the server asks to wait longer than ``_MAX_BACKOFF``,
+    None is returned and the request is not retried.
+    """
+    delay = min(0.1 * 2**attempt, _MAX_BACKOFF)
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                pass
+    if delay > _MAX_BACKOFF:
+        return None
+    return max(delay, 0.0)
+
+
+def _post(url: httpx.URL, body: bytes) -> httpx.Response:
+    """POST an alert body, retrying 429 and 5xx responses with backoff."""
+    client = _get_client()
+    response = client.post(url, content=body, headers=_HEADERS)
+    for attempt in range(_MAX_ATTEMPTS - 1):
+        if response.status_code not in _RETRY_STATUSES:
+            break
+        delay = _backoff(response, attempt)
+        if delay is None:
+            break
+        time.sleep(delay)
+        response = client.post(url, content=body, headers=_HEADERS)
+    return response
+
+
+async def _post_async(url: httpx.URL, body: bytes) -> httpx.Response:
+    """POST an alert body asynchronously, retrying 429 and 5xx responses with backoff."""
+    client = _get_async_client()
+    response = await client.post(url, content=body, headers=_HEADERS)
+    for attempt in range(_MAX_ATTEMPTS - 1):
+        if response.status_code not in _RETRY_STATUSES:
+            break
+        delay = _backoff(response, attempt)
+        if delay is None:
+            break
+        await asyncio.sleep(delay)
+        response = await client.post(url, content=body, headers=_HEADERS)
+    return response
+
+
+# Recently sent alerts: identical alerts within the TTL return the cached response
+# instead of being sent again. Bounded to the most recent entries.
+_DEDUP_MAX_ENTRIES = 512
+_dedup_ttl: float = 5.0
+_DedupKey = Tuple[httpx.URL, bytes]
+_recent: "OrderedDict[_DedupKey, Tuple[float, bytes]]" = OrderedDict()
+_recent_lock = threading.Lock()
+
+
+def set_dedup_ttl(seconds: float) -> None:
+    """Set how long a sent alert suppresses identical alerts.
+
+    Alerts are identical when they are sent with the same integration key and
+    encode to the same request body. A value of 0 disables deduplication.
+
+    Args:
+        seconds: Time window in seconds, defaults to 5.0.
+    """
+    global _dedup_ttl
+    _dedup_ttl = seconds
+    with _recent_lock:
+        _recent.clear()
+
+
+def disable_dedup() -> None:
+    """Disable deduplication of identical alerts."""
+    set_dedup_ttl(0)
+
+
+def _dedup_signature(url: httpx.URL, body: bytes) -> Optional[_DedupKey]:
+    """Return the cache key for an alert, or None if deduplication is disabled.
+
+    The body is encoded with sorted label keys, so identical alerts always
+    produce identical bytes.
+    """
+    if _dedup_ttl <= 0:
+        return None
+    return (url, body)
+
+
+def _dedup_get(sig: Optional[_DedupKey]) -> Optional[SuccessResponse]:
+    """Return a fresh copy of the response to a recently sent identical alert."""
+    if sig is None:
+        return None
+    with _recent_lock:
+        entry = _recent.get(sig)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > _dedup_ttl:
+            del _recent[sig]
+            return None
+        content = entry[1]
+    return _decoder.decode(content)
+
+
+def _dedup_put(sig: Optional[_DedupKey], content: bytes) -> None:
+    """Remember a successful response body, evicting the oldest entries past the limit."""
+    if sig is None:
+        return
+    with _recent_lock:
+        _recent[sig] = (time.monotonic(), content)
+        _recent.move_to_end(sig)
+        while len(_recent) > _DEDUP_MAX_ENTRIES:
+            _recent.popitem(last=False)
+
+
+# Background batcher state, see start_batcher()
+_BatchItem = Tuple[httpx.URL, bytes, "asyncio.Future[httpx.Response]"]
+_batch_queue: Optional["asyncio.Queue[Optional[_BatchItem]]"] = None
+_batch_task: Optional["asyncio.Task[None]"] = None
+
+
+async def start_batcher(max_in_flight: int = 64) -> None:
+    """Start sending ``push_alert_async`` calls from a background task.
+
+    While the batcher runs, ``push_alert_async`` only queues its request. The
+    background task sends each queued alert as soon as it is dequeued, in its
+    own task over the shared client, with at most ``max_in_flight`` requests
+    running at once; further alerts wait in the queue. The standard endpoint
+    takes one event per request, so alerts are not merged into one POST. Must
+    be called from a running event loop; call ``stop_batcher()`` before the
+    loop shuts down.
+
+    Args:
+        max_in_flight: Maximum number of alert requests running at once.
+    """
+    global _batch_queue, _batch_task
+    if _batch_task is not None and not _batch_task.done():
+        return
+    _batch_queue = asyncio.Queue()
+    _batch_task = asyncio.create_task(_run_batcher(_batch_queue, max_in_flight))
+
+
+async def stop_batcher() -> None:
+    """Send all queued alerts and stop the background batcher."""
+    global _batch_queue, _batch_task
+    queue, task = _batch_queue, _batch_task
+    _batch_queue = None
+    _batch_task = None
+    if queue is None or task is None or task.done():
+        return
+    await queue.put(None)
+    await task
+
+
+def _batcher_running() -> bool:
+    """Return True if the batcher is running on the current event loop."""
+    return (
+        _batch_task is not None
+        and not _batch_task.done()
+        and _batch_task.get_loop() is asyncio.get_running_loop()
+    )
+
+
+async def _run_batcher(
+    queue: "asyncio.Queue[Optional[_BatchItem]]", max_in_flight: int
+) -> None:
+    """Send queued alerts until a None sentinel is received.
+
+    Each alert is sent in its own task, so a slow request never holds up the
+    alerts queued behind it. On shutdown the batcher waits for the requests in
+    flight; if it is cancelled instead, every waiting caller gets an error.
+    """
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(max_in_flight)
+    in_flight: "Set[asyncio.Task[None]]" = set()
+
+    def _done(task: "asyncio.Task[None]") -> None:
+        in_flight.discard(task)
+        sem.release()
+
+    try:
+        while True:
+            await sem.acquire()
+            item = await queue.get()
+            if item is None:
+                sem.release()
+                break
+            task = loop.create_task(_dispatch(*item))
+            in_flight.add(task)
+            task.add_done_callback(_done)
+        while in_flight:
+            await asyncio.gather(*in_flight)
+    finally:
+        for task in in_flight:
+            task.cancel()
+        while not queue.empty():
+            item = queue.get_nowait()
+            if item is not None:
+                _fail_unsent(item[2])
+
+
+def _fail_unsent(future: "asyncio.Future[httpx.Response]") -> None:
+    """Wake a caller whose queued alert will not be sent."""
+    if not future.done():
+        future.set_exception(RuntimeError("Alert batcher stopped before the alert was sent"))
+
+
+async def _dispatch(
+    url: httpx.URL, body: bytes, future: "asyncio.Future[httpx.Response]"
+) -> None:
+    """Send one queued alert and hand the outcome to its waiting caller."""
+    try:
+        response = await _post_async(url, body)
+    except asyncio.CancelledError:
+        _fail_unsent(future)
+        raise
+    except Exception as e:
+        if not future.done():
+            future.set_exception(e)
+    else:
+        if not future.done():
+            future.set_result(response)
 
 
-def set_key(api_key: str, user: Optional[str] = None, strategy: Optional[str] = None) -> None:
+# Identical alerts currently being sent; concurrent duplicates await the same request
+_inflight: "Dict[_DedupKey, asyncio.Task[httpx.Response]]" = {}
+
+
+async def _send_async(
+    url: httpx.URL, body: bytes, sig: Optional[_DedupKey]
+) -> httpx.Response:
+    """Send an alert body, sharing one request between identical concurrent alerts.
+
+    The request runs in its own task, so a cancelled caller does not cancel it
+    for the other callers waiting on the same alert. The entry is removed once
+    the request finishes, whether it succeeded or failed.
+    """
+    if sig is None:
+        return await _request_async(url, body, sig)
+    loop = asyncio.get_running_loop()
+    task = _inflight.get(sig)
+    if task is None or task.get_loop() is not loop:
+        task = loop.create_task(_request_async(url, body, sig))
+        _inflight[sig] = task
+        task.add_done_callback(lambda t: _inflight.pop(sig) if _inflight.get(sig) is t else None)
+    else:
+        logger.debug("Joining in-flight duplicate alert")
+    return await asyncio.shield(task)
+
+
+async def _request_async(
+    url: httpx.URL, body: bytes, sig: Optional[_DedupKey]
+) -> httpx.Response:
+    """Send an alert body through the batcher if it is running, else directly."""
+    if _batch_queue is not None and _batcher_running():
+        future = asyncio.get_running_loop().create_future()
+        await _batch_queue.put((url, body, future))
+        response = await future
+    else:
+        response = await _post_async(url, body)
+    if response.is_success:
+        _dedup_put(sig, response.content)
+    return response
+
+
+def close() -> None:
+    """Close the shared synchronous client.
+
+    Asynchronous clients whose event loop is still running are closed on that
+    loop; the others cannot be awaited from here and are dropped, use
+    ``aclose()`` from the event loop to close them gracefully.
+    """
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+        for loop, client in list(_async_clients.items()):
+            if loop.is_running() and not client.is_closed:
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            elif not client.is_closed:
+                logger.debug("Dropping async client of a stopped event loop, use aclose() to close it")
+        _async_clients.clear()
+
+
+async def aclose() -> None:
+    """Close the shared asynchronous client of the running event loop."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+atexit.register(close)
+
+
+try:
+    import uvloop  # noqa: F401
+
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+
+def install_uvloop() -> bool:
+    """Use uvloop as the asyncio event loop policy if it is installed.
+
+    Call this once before starting the event loop. Install the optional
+    dependency with ``pip install flash-call[uvloop]``.
+
+    Returns:
+        True if uvloop was installed as the event loop policy, False otherwise.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def set_key(
+    api_key: str,
+    user: Optional[str] = None,
+    strategy: Optional[str] = None,
+    warm: bool = False,
+) -> None:
     """Set the global integration key for Flashduty API.
 
     Args:
         api_key: The integration key obtained from Flashduty after adding integration.
         user: Optional user identifier to attach to alert labels.
         strategy: Optional strategy identifier to attach to alert labels.
+        warm: If True, open a connection to Flashduty right away so the first
+            alert does not pay for DNS lookup and TCP/TLS handshake. Recommended
+            for latency-sensitive callers.
 
     Example:
         >>> set_key("5c4cfe6e1ae15dfeb73bfc70181f786b073", user="admin", strategy="default")
     """
-    global _integration_key, _user, _strategy
+    global _integration_key, _user, _strategy, _url, _build_payload
     _integration_key = api_key
     _user = user
     _strategy = strategy
+    _url = _build_url(api_key) if api_key else None
+    _build_payload = _make_payload_builder(user, strategy)
+    if warm:
+        _warm()
+
+
+def _warm() -> None:
+    """Open a pooled connection to Flashduty with the shared synchronous client."""
+    try:
+        _get_client().head(BASE_URL, timeout=2.0)
+    except httpx.HTTPError as e:
+        logger.debug(f"Failed to warm connection: {e}")
+
+
+async def warm_async() -> None:
+    """Open a pooled connection to Flashduty with the shared asynchronous client.
+
+    The async counterpart of ``set_key(..., warm=True)``: call it once after
+    ``set_key`` from the event loop that will send alerts, so the first alert
+    does not pay for DNS lookup and TCP/TLS handshake.
+    """
+    try:
+        await _get_async_client().head(BASE_URL, timeout=2.0)
+    except httpx.HTTPError as e:
+        logger.debug(f"Failed to warm connection: {e}")
+
+
+def _build_url(key: str) -> httpx.URL:
+    """Build the push URL with the integration key in its query string."""
+    return httpx.URL(BASE_URL, params={"integration_key": key})
+
+
+def _make_payload_builder(
+    user: Optional[str], strategy: Optional[str]
+) -> Callable[..., _PushAlertRequest]:
+    """Return a payload builder specialized for the configured user and strategy.
+
+    The user/strategy labels are resolved once here, so building a payload only
+    has to handle the per-call optional fields.
+    """
+    extra_labels: Dict[str, str] = {}
+    if user is not None:
+        extra_labels["user_id"] = user
+    if strategy is not None:
+        extra_labels["strategy_id"] = strategy
+
+    def build(
+        title_rule: str,
+        event_status: str,
+        alert_key: Optional[str],
+        description: Optional[str],
+        labels: Optional[Dict[str, str]],
+        images: Optional[List[Image]],
+    ) -> _PushAlertRequest:
+        if labels:
+            if extra_labels:
+                labels = {**labels, **extra_labels}
+        else:
+            labels = extra_labels or None
+        return _PushAlertRequest(title_rule, event_status, alert_key, description, labels, images)
+
+    return build
+
+
+_build_payload = _make_payload_builder(None, None)
 
 
 def get_key() -> Optional[str]:
@@ -142,43 +635,36 @@ def push_alert(
         ...     }
         ... )
         >>> print(response["data"]["alert_key"])
+
+    Raises:
+        ValueError: If no integration key is set or event_status is not a valid status.
     """
-    key = integration_key or _integration_key
-    if not key:
+    # str.__str__ turns str subclasses (e.g. str-based Enum members) into plain strings
+    canonical = _STATUSES.get(str.__str__(event_status)) if isinstance(event_status, str) else None
+    if canonical is None:
+        raise ValueError(f"event_status must be one of {list(_STATUSES)}, got {event_status!r}")
+    event_status = canonical
+
+    url = _build_url(integration_key) if integration_key else _url
+    if url is None:
         raise ValueError("Integration key must be set using set_key() or provided as parameter")
 
-    # Build payload
-    payload: Dict = {
-        "title_rule": title_rule,
-        "event_status": event_status,
-    }
-
-    if alert_key is not None:
-        payload["alert_key"] = alert_key
-    if description is not None:
-        payload["description"] = description
-    effective_labels: Dict[str, str] = dict(labels) if labels is not None else {}
-    if _user is not None:
-        effective_labels["user_id"] = _user
-    if _strategy is not None:
-        effective_labels["strategy_id"] = _strategy
-    if effective_labels:
-        payload["labels"] = effective_labels
-    if images is not None:
-        payload["images"] = images
+    payload = _build_payload(title_rule, event_status, alert_key, description, labels, images)
 
     # Make request
     try:
-        with httpx.Client() as client:
-            response = client.post(
-                BASE_URL,
-                params={"integration_key": key},
-                json=payload,
-                headers={"Content-Type": "application/json"},
-            )
-            response.raise_for_status()
-            logger.info(f"Alert pushed successfully: {response.text}")
-            return response.json()
+        body = _encoder.encode(payload)
+        sig = _dedup_signature(url, body)
+        cached = _dedup_get(sig)
+        if cached is not None:
+            logger.debug(f"Skipping duplicate alert: {title_rule}")
+            return cached
+        response = _post(url, body)
+        response.raise_for_status()
+        logger.info(f"Alert pushed successfully: {response.text}")
+        result = _decoder.decode(response.content)
+        _dedup_put(sig, response.content)
+        return result
 
     except httpx.HTTPStatusError as e:
         error_msg = f"HTTP error {e.response.status_code}: {e.response.reason_phrase}"
@@ -235,43 +721,34 @@ async def push_alert_async(
         ...     )
         ...     print(response["data"]["alert_key"])
         >>> asyncio.run(main())
+
+    Raises:
+        ValueError: If no integration key is set or event_status is not a valid status.
     """
-    key = integration_key or _integration_key
-    if not key:
+    # str.__str__ turns str subclasses (e.g. str-based Enum members) into plain strings
+    canonical = _STATUSES.get(str.__str__(event_status)) if isinstance(event_status, str) else None
+    if canonical is None:
+        raise ValueError(f"event_status must be one of {list(_STATUSES)}, got {event_status!r}")
+    event_status = canonical
+
+    url = _build_url(integration_key) if integration_key else _url
+    if url is None:
         raise ValueError("Integration key must be set using set_key() or provided as parameter")
 
-    # Build payload
-    payload: Dict = {
-        "title_rule": title_rule,
-        "event_status": event_status,
-    }
-
-    if alert_key is not None:
-        payload["alert_key"] = alert_key
-    if description is not None:
-        payload["description"] = description
-    effective_labels: Dict[str, str] = dict(labels) if labels is not None else {}
-    if _user is not None:
-        effective_labels["user_id"] = _user
-    if _strategy is not None:
-        effective_labels["strategy_id"] = _strategy
-    if effective_labels:
-        payload["labels"] = effective_labels
-    if images is not None:
-        payload["images"] = images
+    payload = _build_payload(title_rule, event_status, alert_key, description, labels, images)
 
     # Make request
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                BASE_URL,
-                params={"integration_key": key},
-                json=payload,
-                headers={"Content-Type": "application/json"},
-            )
-            response.raise_for_status()
-            logger.info(f"Alert pushed successfully: {response.text}")
-            return response.json()
+        body = _encoder.encode(payload)
+        sig = _dedup_signature(url, body)
+        cached = _dedup_get(sig)
+        if cached is not None:
+            logger.debug(f"Skipping duplicate alert: {title_rule}")
+            return cached
+        response = await _send_async(url, body, sig)
+        response.raise_for_status()
+        logger.info(f"Alert pushed successfully: {response.text}")
+        return _decoder.decode(response.content)
 
     except httpx.HTTPStatusError as e:
         error_msg = f"HTTP error {e.response.status_code}: {e.response.reason_phrase}"
@@ -289,14 +766,107 @@ async def push_alert_async(
         return {"error": error_msg}
 
 
+async def push_alerts_async(
+    events: Sequence[Mapping[str, Any]],
+    *,
+    max_concurrency: int = 50,
+    return_exceptions: bool = True,
+) -> List[Union[SuccessResponse, SimpleErrorResponse, BaseException]]:
+    """Push many alert events to Flashduty concurrently.
+
+    All events are sent over the shared asynchronous client, so they reuse the
+    same pool of keep-alive connections.
+
+    Args:
+        events: Sequence of keyword-argument mappings accepted by ``push_alert_async``.
+        max_concurrency: Maximum number of requests in flight at once.
+        return_exceptions: If True, exceptions are returned in place of results
+            instead of being raised.
+
+    Returns:
+        List of results in the same order as ``events``.
+
+    Example:
+        >>> import asyncio
+        >>> set_key("your-integration-key")
+        >>> results = asyncio.run(push_alerts_async([
+        ...     {"title_rule": "High CPU usage on server-01", "event_status": "Warning"},
+        ...     {"title_rule": "Disk space low on server-03", "event_status": "Critical"},
+        ... ]))
+    """
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def _one(event: Mapping[str, Any]) -> Union[SuccessResponse, SimpleErrorResponse]:
+        async with sem:
+            return await push_alert_async(**event)
+
+    return await asyncio.gather(
+        *(_one(event) for event in events), return_exceptions=return_exceptions
+    )
+
+
+# Tasks created by push_alert_nowait() that have not finished yet. Holding a
+# reference keeps them from being garbage collected mid-flight.
+_pending: "Set[asyncio.Task[Union[SuccessResponse, SimpleErrorResponse]]]" = set()
+
+
+def push_alert_nowait(
+    **kwargs: Any,
+) -> "asyncio.Task[Union[SuccessResponse, SimpleErrorResponse]]":
+    """Schedule an alert to be pushed in the background and return immediately.
+
+    Accepts the same keyword arguments as ``push_alert_async``. Unlike awaiting
+    ``push_alert_async``, the caller does not wait for the network round-trip,
+    so failures are only visible on the returned task (and in the log). Must be
+    called from a running event loop; await ``drain()`` before the loop shuts
+    down so pending alerts are not lost.
+
+    Returns:
+        The task sending the alert.
+
+    Example:
+        >>> async def main():
+        ...     set_key("your-integration-key")
+        ...     push_alert_nowait(title_rule="cpu idle low than 20%", event_status="Warning")
+        ...     await drain()
+        >>> asyncio.run(main())
+    """
+    task = asyncio.get_running_loop().create_task(push_alert_async(**kwargs))
+    _pending.add(task)
+    task.add_done_callback(_pending.discard)
+    return task
+
+
+async def drain() -> None:
+    """Wait for all alerts scheduled with ``push_alert_nowait`` to finish."""
+    loop = asyncio.get_running_loop()
+    while True:
+        tasks = [task for task in _pending if task.get_loop() is loop]
+        if not tasks:
+            return
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
 # Public API
 __all__ = [
     "set_key",
+    "warm_async",
     "get_key",
     "get_user",
     "get_strategy",
     "push_alert",
     "push_alert_async",
+    "push_alerts_async",
+    "push_alert_nowait",
+    "drain",
+    "start_batcher",
+    "stop_batcher",
+    "set_dedup_ttl",
+    "disable_dedup",
+    "close",
+    "aclose",
+    "install_uvloop",
+    "HAS_UVLOOP",
     "EventStatus",
     "Image",
     "AlertData",
@@ -0,0 +1,157 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+import flash_call
+
+
+@pytest.fixture(autouse=True)
+def _setup():
+    flash_call.set_key("test-key")
+    flash_call.disable_dedup()
+    yield
+    flash_call.set_dedup_ttl(5.0)
+
+
+class MockServer:
+    """Mock Flashduty endpoint that sleeps ``delays[title]`` seconds per alert."""
+
+    def __init__(self, delays=None):
+        self.delays = delays or {}
+        self.titles = []
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, request):
+        title = json.loads(request.content)["title_rule"]
+        self.titles.append(title)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(title, 0.01))
+        finally:
+            self.active -= 1
+        return httpx.Response(200, json={"request_id": "r", "data": {"alert_key": title}})
+
+    def install(self):
+        flash_call._get_async_client()._transport = httpx.MockTransport(self)
+
+
+def _alert_key(response):
+    return response["data"]["alert_key"]
+
+
+def test_slow_request_does_not_block_later_alerts():
+    server = MockServer({"slow": 1.0})
+
+    async def main():
+        server.install()
+        await flash_call.start_batcher()
+        try:
+            slow = asyncio.create_task(flash_call.push_alert_async("slow", "Info"))
+            await asyncio.sleep(0.05)
+            t0 = time.perf_counter()
+            fast = await flash_call.push_alert_async("fast", "Info")
+            elapsed = time.perf_counter() - t0
+            assert not slow.done()
+        finally:
+            await flash_call.stop_batcher()
+        return fast, elapsed, await slow
+
+    fast, elapsed, slow = asyncio.run(main())
+    assert _alert_key(fast) == "fast"
+    assert elapsed < 0.5
+    assert _alert_key(slow) == "slow"
+
+
+def test_lone_alert_is_sent_without_delay():
+    server = MockServer({"lone": 0})
+
+    async def main():
+        server.install()
+        await flash_call.start_batcher()
+        try:
+            t0 = time.perf_counter()
+            response = await flash_call.push_alert_async("lone", "Info")
+            return response, time.perf_counter() - t0
+        finally:
+            await flash_call.stop_batcher()
+
+    response, elapsed = asyncio.run(main())
+    assert _alert_key(response) == "lone"
+    assert elapsed < 0.04
+
+
+def test_max_in_flight_limits_concurrent_requests():
+    server = MockServer()
+
+    async def main():
+        server.install()
+        await flash_call.start_batcher(max_in_flight=2)
+        try:
+            return await asyncio.gather(
+                *(flash_call.push_alert_async(f"a{i}", "Info") for i in range(6))
+            )
+        finally:
+            await flash_call.stop_batcher()
+
+    responses = asyncio.run(main())
+    assert [_alert_key(r) for r in responses] == [f"a{i}" for i in range(6)]
+    assert server.max_active == 2
+
+
+def test_stop_sends_queued_and_in_flight_alerts():
+    server = MockServer({"a0": 0.1, "a1": 0.1, "a2": 0.1})
+
+    async def main():
+        server.install()
+        await flash_call.start_batcher(max_in_flight=1)
+        tasks = [
+            asyncio.create_task(flash_call.push_alert_async(f"a{i}", "Info")) for i in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        await flash_call.stop_batcher()
+        assert all(task.done() for task in tasks)
+        return [task.result() for task in tasks]
+
+    responses = asyncio.run(main())
+    assert [_alert_key(r) for r in responses] == ["a0", "a1", "a2"]
+    assert flash_call._batch_task is None
+
+
+def test_cancel_fails_waiting_callers():
+    server = MockServer({"a0": 1.0})
+
+    async def main():
+        server.install()
+        await flash_call.start_batcher(max_in_flight=1)
+        tasks = [
+            asyncio.create_task(flash_call.push_alert_async(f"a{i}", "Info")) for i in range(3)
+        ]
+        await asyncio.sleep(0.05)
+        flash_call._batch_task.cancel()
+        responses = await asyncio.wait_for(asyncio.gather(*tasks), 1.0)
+        await flash_call.stop_batcher()
+        return responses
+
+    responses = asyncio.run(main())
+    assert responses == [
+        {"error": "Alert batcher stopped before the alert was sent"}
+    ] * 3
+    assert server.titles == ["a0"]
+
+
+def test_alerts_are_sent_directly_after_stop():
+    server = MockServer()
+
+    async def main():
+        server.install()
+        await flash_call.start_batcher()
+        await flash_call.stop_batcher()
+        return await flash_call.push_alert_async("direct", "Info")
+
+    assert _alert_key(asyncio.run(main())) == "direct"
+    assert server.titles == ["direct"]
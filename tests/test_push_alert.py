@@ -0,0 +1,98 @@
+import asyncio
+import json
+from enum import Enum
+
+import httpx
+import pytest
+
+import flash_call
+
+
+class Status(str, Enum):
+    WARNING = "Warning"
+
+
+@pytest.fixture(autouse=True)
+def _setup():
+    flash_call.set_key("test-key")
+    flash_call.disable_dedup()
+    yield
+    flash_call.set_dedup_ttl(5.0)
+
+
+@pytest.fixture
+def sent():
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={"request_id": "r", "data": {"alert_key": "k"}})
+
+    flash_call._get_client()._transport = httpx.MockTransport(handler)
+    return bodies
+
+
+def test_str_enum_status_is_sent_as_plain_string(sent):
+    response = flash_call.push_alert("title", Status.WARNING)
+    assert response["data"]["alert_key"] == "k"
+    assert sent[0]["event_status"] == "Warning"
+
+
+@pytest.mark.parametrize("status", ["critcal", "warning", None, 1, ["Ok"]])
+def test_invalid_status_raises_value_error(sent, status):
+    with pytest.raises(ValueError, match="event_status must be one of"):
+        flash_call.push_alert("title", status)
+    with pytest.raises(ValueError, match="event_status must be one of"):
+        asyncio.run(flash_call.push_alert_async("title", status))
+    assert sent == []
+
+
+def _install(handler):
+    flash_call._get_client()._transport = httpx.MockTransport(handler)
+
+
+def test_retries_5xx_with_backoff(monkeypatch):
+    delays = []
+    monkeypatch.setattr(flash_call.time, "sleep", delays.append)
+    statuses = [503, 502, 200]
+
+    def handler(request):
+        return httpx.Response(statuses.pop(0), json={"request_id": "r", "data": {"alert_key": "k"}})
+
+    _install(handler)
+    response = flash_call.push_alert("title", "Warning")
+    assert response["data"]["alert_key"] == "k"
+    assert delays == [0.1, 0.2]
+
+
+def test_short_retry_after_is_honored(monkeypatch):
+    delays = []
+    monkeypatch.setattr(flash_call.time, "sleep", delays.append)
+    statuses = [429, 200]
+
+    def handler(request):
+        return httpx.Response(
+            statuses.pop(0),
+            headers={"Retry-After": "1"},
+            json={"request_id": "r", "data": {"alert_key": "k"}},
+        )
+
+    _install(handler)
+    assert flash_call.push_alert("title", "Warning")["data"]["alert_key"] == "k"
+    assert delays == [1.0]
+
+
+def test_long_retry_after_is_not_retried(monkeypatch):
+    delays = []
+    monkeypatch.setattr(flash_call.time, "sleep", delays.append)
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(429, headers={"Retry-After": "60"})
+
+    _install(handler)
+    response = flash_call.push_alert("title", "Warning")
+    assert response == {"error": "HTTP error 429: Too Many Requests"}
+    assert len(requests) == 1
+    assert delays == []